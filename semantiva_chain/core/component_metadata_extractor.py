@@ -12,20 +12,37 @@ This metadata enables AI-powered workflow analysis, consistency validation, and
 documentation generation.
 """
 
+import functools
 import inspect
-from typing import Dict, Any, Type
+import types
+import typing
+from typing import Callable, Dict, Any, Mapping, Type
 from semantiva.component_loader.component_loader import ComponentLoader
 from semantiva.data_types.data_types import BaseDataType
 
 
+# Component classes resolved so far, keyed by component name
+_CLASS_CACHE: Dict[str, Type] = {}
+
+
 class ComponentMetadataExtractor:
     """
     Extracts metadata from Semantiva components.
 
+    Component classes are cached by name and reflection results are cached per
+    component class, so components that appear several times in a workflow
+    (or across workflows) are only looked up and inspected once.
+
     Methods:
         get_metadata(component_name: str) -> Dict[str, Any]:
             Retrieves structured metadata for the given component.
 
+        is_cached(component_name: str) -> bool:
+            Tells whether the component's class has already been resolved.
+
+        _get_class_metadata(cls: Type) -> Mapping[str, Any]:
+            Returns the cached, read-only metadata of a component class.
+
         _get_class_hierarchy(cls: Type) -> list:
             Returns the class hierarchy of the component.
 
@@ -34,6 +51,12 @@ class ComponentMetadataExtractor:
 
         _get_processing_logic(cls: Type) -> Dict[str, Any]:
             Extracts details of the processing logic, including parameters.
+
+        _resolve_type_hints(fn: Callable) -> Dict[str, Any]:
+            Resolves the type hints of a function.
+
+        _format_type(annotation: Any) -> str:
+            Renders a type annotation as a readable string.
     """
 
     @staticmethod
@@ -46,26 +69,65 @@ class ComponentMetadataExtractor:
 
         Returns:
             Dict[str, Any]: A dictionary containing the component's metadata.
+                The dictionary itself is a new copy, but the values in it are
+                shared with the cache and must not be modified.
         """
-        component_class = ComponentLoader.get_class(component_name)
+        component_class = _CLASS_CACHE.get(component_name)
+        if component_class is None:
+            component_class = ComponentLoader.get_class(component_name)
+            if component_class:
+                _CLASS_CACHE[component_name] = component_class
 
         if not component_class:
             return {"error": f"Component '{component_name}' not found."}
 
         return {
             "component_name": component_name,
-            "module_path": component_class.__module__,
-            "class_hierarchy": ComponentMetadataExtractor._get_class_hierarchy(
-                component_class
-            ),
-            "interfaces": ComponentMetadataExtractor._get_interfaces(component_class),
-            "processing_logic": ComponentMetadataExtractor._get_processing_logic(
-                component_class
-            ),
-            "docstring": inspect.getdoc(component_class),
+            **ComponentMetadataExtractor._get_class_metadata(component_class),
         }
 
     @staticmethod
+    def is_cached(component_name: str) -> bool:
+        """
+        Tells whether the class of a component has already been resolved.
+
+        Metadata for a cached component can be retrieved without loading it.
+
+        Args:
+            component_name (str): The name of the component.
+
+        Returns:
+            bool: True if the component class is cached.
+        """
+        return component_name in _CLASS_CACHE
+
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def _get_class_metadata(cls: Type) -> Mapping[str, Any]:
+        """
+        Retrieves the metadata of a component class, computed once per class.
+
+        The returned mapping is shared between calls, so it is read-only;
+        `get_metadata` hands out shallow copies of it without copying the
+        values.
+
+        Args:
+            cls (Type): The component class.
+
+        Returns:
+            Mapping[str, Any]: Metadata about the component class.
+        """
+        metadata = {
+            "module_path": cls.__module__,
+            "class_hierarchy": ComponentMetadataExtractor._get_class_hierarchy(cls),
+            "interfaces": ComponentMetadataExtractor._get_interfaces(cls),
+            "processing_logic": ComponentMetadataExtractor._get_processing_logic(cls),
+            "docstring": inspect.getdoc(cls),
+        }
+        return types.MappingProxyType(metadata)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
     def _get_class_hierarchy(cls: Type) -> list:
         """
         Retrieves the class hierarchy of a component.
@@ -81,6 +143,7 @@ class ComponentMetadataExtractor:
         ]
 
     @staticmethod
+    @functools.lru_cache(maxsize=None)
     def _get_interfaces(cls: Type) -> list:
         """
         Extracts input and output data types from the component.
@@ -92,20 +155,20 @@ class ComponentMetadataExtractor:
             list: A list of dictionaries representing input/output types.
         """
         interfaces = []
-        if hasattr(cls, "input_data_type") and callable(cls.input_data_type):
+        input_data_type = getattr(cls, "input_data_type", None)
+        if callable(input_data_type):
             interfaces.append(
-                {"interface_type": "input", "data_type": cls.input_data_type().__name__}
+                {"interface_type": "input", "data_type": input_data_type().__name__}
             )
-        if hasattr(cls, "output_data_type") and callable(cls.output_data_type):
+        output_data_type = getattr(cls, "output_data_type", None)
+        if callable(output_data_type):
             interfaces.append(
-                {
-                    "interface_type": "output",
-                    "data_type": cls.output_data_type().__name__,
-                }
+                {"interface_type": "output", "data_type": output_data_type().__name__}
             )
         return interfaces
 
     @staticmethod
+    @functools.lru_cache(maxsize=None)
     def _get_processing_logic(cls: Type) -> Dict[str, Any]:
         """
         Extracts details of the processing logic, including parameters and types.
@@ -119,14 +182,16 @@ class ComponentMetadataExtractor:
         if not hasattr(cls, "_process_logic"):
             return {"error": "Processing logic not defined"}
 
-        signature = inspect.signature(cls._process_logic)
+        # Prefer an explicitly attached signature over re-deriving it
+        signature = getattr(cls._process_logic, "__signature__", None)
+        if not isinstance(signature, inspect.Signature):
+            signature = inspect.signature(cls._process_logic)
+        hints = ComponentMetadataExtractor._resolve_type_hints(cls._process_logic)
         parameters = [
             {
                 "name": param.name,
-                "type": (
-                    param.annotation.__name__
-                    if param.annotation != param.empty
-                    else "Unknown"
+                "type": ComponentMetadataExtractor._format_type(
+                    hints.get(param.name, param.annotation)
                 ),
             }
             for param in signature.parameters.values()
@@ -137,3 +202,85 @@ class ComponentMetadataExtractor:
             "parameters": parameters,
             "description": inspect.getdoc(cls._process_logic),
         }
+
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def _resolve_type_hints(fn: Callable) -> Dict[str, Any]:
+        """
+        Resolves the type hints of a function, including string forward references.
+
+        If some hints cannot be resolved, each annotation is resolved on its
+        own, and only those that fail are kept as written.
+
+        Args:
+            fn (Callable): The function to inspect.
+
+        Returns:
+            Dict[str, Any]: A mapping of parameter names to their annotations.
+        """
+        try:
+            return typing.get_type_hints(fn)
+        except Exception:
+            pass
+
+        globalns = getattr(fn, "__globals__", None)
+        hints = {}
+        for name, annotation in getattr(fn, "__annotations__", {}).items():
+            try:
+                hints.update(
+                    typing.get_type_hints(
+                        types.SimpleNamespace(__annotations__={name: annotation}),
+                        globalns=globalns,
+                    )
+                )
+            except Exception:
+                hints[name] = annotation
+        return hints
+
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def _format_type(annotation: Any) -> str:
+        """
+        Renders a type annotation as a readable string.
+
+        Handles plain classes, generics (e.g. `List[int]`), unions (including
+        PEP 604 `int | None`) and unresolved string annotations.
+
+        Args:
+            annotation (Any): The annotation to render.
+
+        Returns:
+            str: The rendered type, or "Unknown" if there is no annotation.
+        """
+        if annotation is inspect.Parameter.empty:
+            return "Unknown"
+        if annotation is None or annotation is type(None):
+            return "None"
+        if isinstance(annotation, str):
+            return annotation
+        if isinstance(annotation, typing.ForwardRef):
+            return annotation.__forward_arg__
+
+        origin = typing.get_origin(annotation)
+        args = typing.get_args(annotation)
+        if origin is None:
+            return getattr(
+                annotation, "__name__", str(annotation).replace("typing.", "")
+            )
+
+        def format_arg(arg: Any) -> str:
+            if isinstance(arg, (list, tuple)):
+                return "[" + ", ".join(format_arg(a) for a in arg) + "]"
+            if arg is Ellipsis:
+                return "..."
+            if origin is typing.Literal:
+                return repr(arg)
+            return ComponentMetadataExtractor._format_type(arg)
+
+        if origin is typing.Union or origin is getattr(types, "UnionType", None):
+            return " | ".join(format_arg(arg) for arg in args)
+
+        name = getattr(origin, "__name__", None) or str(origin).replace("typing.", "")
+        if not args:
+            return name
+        return f"{name}[{', '.join(format_arg(arg) for arg in args)}]"
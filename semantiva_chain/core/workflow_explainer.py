@@ -5,14 +5,194 @@ Extracts workflow metadata, analyzes processing steps, and formulates
 human-readable descriptions of the workflow’s function and structure.
 """
 
+import asyncio
+import io
 import os
-from typing import List, Dict, Any, Optional
+import re
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import List, Dict, Any, Callable, Hashable, Iterator, Optional, Tuple
 from semantiva.logger import Logger
 from semantiva_chain.core.component_metadata_extractor import ComponentMetadataExtractor
 from semantiva_chain.llm.llm_factory import LLMFactory
+from semantiva_chain.llm.llm_interface import LLMError
 from pprint import pformat
 
 
+_MAX_EXTRACTION_WORKERS = 8
+
+# Output tokens requested per workflow in a batched request, matching the
+# default of a single request, and the number of workflows per batch, kept low
+# enough that the combined output limit stays within what models accept
+_MAX_TOKENS_PER_WORKFLOW = 1000
+_MAX_BATCH_WORKFLOWS = 4
+
+# Static instructions, sent as the system message by providers that support
+# one and prepended to the prompt otherwise. Every request thus starts with the
+# same text, and only the workflow description after it changes between calls.
+_SYSTEM_PROMPT = (
+    "You are an AI workflow assistant. Given a pipeline configuration, explain "
+    "how it works in a clear and structured manner. Provide a detailed, "
+    "structured, and human-readable explanation of the workflow."
+)
+
+_BATCH_PROMPT_TEMPLATE = """\
+Several pipeline configurations follow. Explain each of them, wrapping the \
+explanation of workflow N between the markers [N] and [/N].
+
+{workflows}
+"""
+
+_WORKFLOW_TEMPLATE = """\
+**Pipeline Configuration:**
+{pipeline_structure}
+
+**Component Details:**
+{component_descriptions}"""
+
+
+def estimate_token_count(prompt: str) -> int:
+    """
+    Cheaply estimates the number of tokens a prompt will use.
+
+    Takes the larger of the number of whitespace-separated words and one token
+    per four characters, a common approximation for BPE tokenizers. Intended
+    for budget checks before a prompt is sent, not for exact accounting.
+
+    Args:
+        prompt (str): The prompt to measure.
+
+    Returns:
+        int: The estimated number of tokens.
+    """
+    return max(len(prompt.split()), -(-len(prompt) // 4))
+
+
+def _batch_prompt(sections: List[str]) -> str:
+    """
+    Combines tagged workflow sections into a single batched prompt.
+
+    Args:
+        sections (List[str]): The workflow prompts, each already wrapped
+            with its `[N]` marker.
+
+    Returns:
+        str: The batched prompt.
+    """
+    return _BATCH_PROMPT_TEMPLATE.format_map({"workflows": "\n\n".join(sections)})
+
+
+class _LazyStr:
+    """
+    Defers building a string until it is actually formatted.
+
+    Passed as a logging argument so that expensive messages are only rendered
+    if the record is emitted.
+    """
+
+    def __init__(self, fn: Callable[[], str]):
+        self.fn = fn
+
+    def __str__(self) -> str:
+        return self.fn()
+
+
+# Rendered component descriptions, keyed by component name, along with the
+# metadata they were rendered from
+_RENDERED_COMPONENTS: Dict[str, Tuple[Dict[str, Any], str]] = {}
+
+
+def _render_component(comp: Dict[str, Any]) -> str:
+    """
+    Renders the description of a component for inclusion in an LLM prompt.
+
+    Component metadata is static, so the rendered text is cached per component
+    and reused wherever the component appears, as long as the component's
+    metadata is unchanged.
+
+    Args:
+        comp (Dict[str, Any]): The extracted metadata of the component.
+
+    Returns:
+        str: A structured description of the component.
+    """
+    cached = _RENDERED_COMPONENTS.get(comp["component_name"])
+    if cached is not None and cached[0] == comp:
+        return cached[1]
+
+    buf = io.StringIO()
+    buf.write(f"- {comp['component_name']}:\n")
+    buf.write(f"  Description: {comp.get('docstring', 'No description available.')}\n")
+    buf.write(f"  Module: {comp.get('module_path', 'Unknown')}\n")
+    buf.write(
+        f"  Class Hierarchy: {', '.join(map(str, comp.get('class_hierarchy', [])))}\n"
+    )
+    buf.write("  Interfaces:\n")
+    sep = ""
+    for iface in comp.get("interfaces", []):
+        if (
+            isinstance(iface, dict)
+            and "interface_type" in iface
+            and "data_type" in iface
+        ):
+            buf.write(f"{sep}    - {iface['interface_type']}: {iface['data_type']}")
+            sep = "\n"
+    buf.write("\n  Processing Logic:\n")
+    sep = ""
+    for param in comp.get("processing_logic", {}).get("parameters", []):
+        if isinstance(param, dict) and "name" in param and "type" in param:
+            buf.write(f"{sep}    - {param['name']}: {param['type']}")
+            sep = "\n"
+    rendered = buf.getvalue()
+    _RENDERED_COMPONENTS[comp["component_name"]] = (dict(comp), rendered)
+    return rendered
+
+
+_PLAIN_TYPES = (str, int, float, bool, type(None))
+
+
+def _freeze(value: Any) -> Hashable:
+    """
+    Converts plain data into a hashable form that compares by value.
+
+    Each value is tagged with its type, so that e.g. `1`, `1.0` and `True`, or
+    a list and a tuple with the same items, produce different results.
+
+    Args:
+        value (Any): The data to convert.
+
+    Returns:
+        Hashable: The canonical form of the data.
+
+    Raises:
+        TypeError: If the data contains anything other than dicts, lists,
+            tuples, strings, numbers, booleans and None.
+    """
+    if type(value) in _PLAIN_TYPES:
+        return (type(value).__name__, value)
+    if type(value) is dict:
+        return ("dict", frozenset((_freeze(k), _freeze(v)) for k, v in value.items()))
+    if type(value) in (list, tuple):
+        return (type(value).__name__, tuple(_freeze(item) for item in value))
+    raise TypeError(f"Cannot build a cache key from {type(value).__name__}")
+
+
+@dataclass(slots=True)
+class NormalizedNode:
+    """
+    A pipeline node configuration with its fields resolved once.
+
+    Attributes:
+        processor (str): The name of the node's processor.
+        context_keyword (str): The context keyword of the node ("None" if unset).
+        parameters (dict): The node parameters (empty if unset).
+    """
+
+    processor: str
+    context_keyword: str
+    parameters: Dict[str, Any]
+
+
 class WorkflowExplainer:
     """
     Provides workflow analysis and explanations.
@@ -20,9 +200,24 @@ class WorkflowExplainer:
     This class extracts metadata from Semantiva pipeline configurations and
     generates natural language explanations using an LLM.
 
+    Explanations are cached per configuration, so explaining an identical
+    workflow again does not query the LLM a second time.
+
     Methods:
         explain(node_configurations: list) -> str:
             Generates a human-readable explanation of the specified workflow.
+
+        explain_stream(node_configurations: list) -> Iterator[str]:
+            Yields the explanation of the specified workflow as it is generated.
+
+        explain_many(list_of_node_configurations: list) -> list:
+            Explains several workflows with a single batched LLM request.
+
+        explain_many_async(list_of_node_configurations: list) -> list:
+            Explains several workflows with concurrent LLM requests.
+
+        clear_cache() -> None:
+            Discards all cached explanations and component descriptions.
     """
 
     def __init__(self, logger: Optional[Logger] = None):
@@ -30,8 +225,15 @@ class WorkflowExplainer:
         Initializes the WorkflowExplainer with an LLM instance.
 
         The LLM provider is determined dynamically from environment variables.
+        If `LLM_MAX_PROMPT_TOKENS` is set, workflows whose prompt is estimated
+        to exceed that many tokens are rejected instead of being sent.
+
+        Raises:
+            ValueError: If `LLM_MAX_PROMPT_TOKENS` is not a positive integer.
         """
         self.logger = logger if logger else Logger()
+        # Explanations already generated, keyed by canonical workflow configuration
+        self._response_cache: Dict[Hashable, str] = {}
 
         llm_provider = os.getenv("LLM_PROVIDER", "openai")
         self.logger.info(
@@ -42,6 +244,7 @@ class WorkflowExplainer:
             api_key=os.getenv("LLM_API_KEY"),
             model=os.getenv("LLM_MODEL"),
         )
+        self.max_prompt_tokens = self._read_max_prompt_tokens()
 
     def explain(self, node_configurations: List[Dict[str, Any]]) -> str:
         """
@@ -53,106 +256,442 @@ class WorkflowExplainer:
         Returns:
             str: Natural language explanation of the workflow.
         """
+        key = self._cache_key(node_configurations)
+        if key in self._response_cache:
+            return self._response_cache[key]
+
+        nodes, components, error = self._extract_components(node_configurations)
+        if error:
+            return error
+
+        prompt = self._generate_prompt(nodes, components)
+        error = self._check_prompt_size(prompt)
+        if error:
+            return error
+
+        try:
+            response = self.llm.generate_response(
+                *self.llm.prepare_request(prompt, _SYSTEM_PROMPT)
+            )
+        except LLMError as e:
+            return f"Error: {e}"
+
+        self._cache_response(key, response)
+        return response
+
+    def explain_stream(
+        self, node_configurations: List[Dict[str, Any]]
+    ) -> Iterator[str]:
+        """
+        Generates an explanation for a pipeline configuration, streaming it in chunks.
+
+        Args:
+            node_configurations (list): List of pipeline node configurations.
+
+        Yields:
+            str: Successive fragments of the natural language explanation.
+        """
+        key = self._cache_key(node_configurations)
+        if key in self._response_cache:
+            yield self._response_cache[key]
+            return
+
+        nodes, components, error = self._extract_components(node_configurations)
+        if error:
+            yield error
+            return
+
+        prompt = self._generate_prompt(nodes, components)
+        error = self._check_prompt_size(prompt)
+        if error:
+            yield error
+            return
+
+        chunks = []
+        try:
+            for chunk in self.llm.generate_response_stream(
+                *self.llm.prepare_request(prompt, _SYSTEM_PROMPT)
+            ):
+                chunks.append(chunk)
+                yield chunk
+        except LLMError as e:
+            yield f"Error: {e}"
+            return
+
+        self._cache_response(key, "".join(chunks))
+
+    def explain_many(
+        self, list_of_node_configurations: List[List[Dict[str, Any]]]
+    ) -> List[str]:
+        """
+        Generates explanations for several pipeline configurations at once.
+
+        Valid workflows are combined into batched prompts in which each
+        workflow is tagged with its position, so the LLM is queried once per
+        batch of up to `_MAX_BATCH_WORKFLOWS` workflows rather than once per
+        workflow. If `max_prompt_tokens` is set, batches are also kept within
+        it. Each request allows `_MAX_TOKENS_PER_WORKFLOW` output tokens per
+        workflow it holds, and its segmented response is split back into one
+        explanation per workflow.
+
+        Args:
+            list_of_node_configurations (list): A list of pipeline node
+                configurations, one per workflow.
+
+        Returns:
+            list: One explanation (or error message) per workflow, in the
+                order the workflows were given.
+        """
+        results, keys, pending = self._prepare_prompts(list_of_node_configurations)
+        sections = [(idx, f"[{idx + 1}]\n{prompt}") for idx, prompt in pending]
+
+        for batch in self._pack_sections(sections):
+            prompt = _batch_prompt([section for _, section in batch])
+            error = self._check_prompt_size(prompt)
+            if not error:
+                try:
+                    response = self.llm.generate_response(
+                        *self.llm.prepare_request(
+                            prompt,
+                            _SYSTEM_PROMPT,
+                            {"max_tokens": _MAX_TOKENS_PER_WORKFLOW * len(batch)},
+                        )
+                    )
+                except LLMError as e:
+                    error = f"Error: {e}"
+            if error:
+                # The batched request failed as a whole, so each of its
+                # workflows gets the error
+                for idx, _ in batch:
+                    results[idx] = error
+                continue
+
+            explanations = {
+                int(idx): text.strip()
+                for idx, text in re.findall(
+                    r"\[(\d+)\](.*?)\[/\1\]", response, re.DOTALL
+                )
+            }
+            for idx, _ in batch:
+                if idx + 1 in explanations:
+                    results[idx] = explanations[idx + 1]
+                    self._cache_response(keys[idx], results[idx])
+                else:
+                    results[idx] = (
+                        f"Error: No explanation returned for workflow {idx + 1}."
+                    )
+        return results
+
+    async def explain_many_async(
+        self, list_of_node_configurations: List[List[Dict[str, Any]]]
+    ) -> List[str]:
+        """
+        Generates explanations for several pipeline configurations concurrently.
+
+        Each workflow gets its own prompt, and all prompts are sent to the LLM
+        at the same time rather than one after the other. The prompts are
+        built in a worker thread, so the event loop is not blocked meanwhile.
+
+        Args:
+            list_of_node_configurations (list): A list of pipeline node
+                configurations, one per workflow.
+
+        Returns:
+            list: One explanation (or error message) per workflow, in the
+                order the workflows were given.
+        """
+        # Extraction loads components and may start a thread pool, so it runs in
+        # a worker thread to keep the event loop responsive
+        results, keys, pending = await asyncio.to_thread(
+            self._prepare_prompts, list_of_node_configurations
+        )
+
+        responses = await asyncio.gather(
+            *[
+                self.llm.agenerate_response(
+                    *self.llm.prepare_request(prompt, _SYSTEM_PROMPT)
+                )
+                for _, prompt in pending
+            ],
+            return_exceptions=True,
+        )
+        for (idx, _), response in zip(pending, responses):
+            if isinstance(response, LLMError):
+                results[idx] = f"Error: {response}"
+            elif isinstance(response, BaseException):
+                raise response
+            else:
+                results[idx] = response
+                self._cache_response(keys[idx], response)
+        return results
+
+    def clear_cache(self) -> None:
+        """
+        Discards all cached explanations, so the next requests query the LLM again.
+
+        The rendered component descriptions, which are shared by all explainers,
+        are discarded as well.
+        """
+        self._response_cache.clear()
+        _RENDERED_COMPONENTS.clear()
+
+    @staticmethod
+    def _cache_key(node_configurations: List[Dict[str, Any]]) -> Optional[Hashable]:
+        """
+        Builds a canonical cache key for a pipeline configuration.
+
+        Only configurations made of plain data (dicts, lists, tuples, strings,
+        numbers, booleans and None) are cacheable, since other objects cannot
+        be reliably compared by value.
+
+        Args:
+            node_configurations (list): List of pipeline node configurations.
+
+        Returns:
+            Optional[Hashable]: The key, or None if the configuration cannot
+                be cached.
+        """
+        try:
+            return _freeze(node_configurations)
+        except TypeError:
+            return None
+
+    def _pack_sections(
+        self, sections: List[Tuple[int, str]]
+    ) -> List[List[Tuple[int, str]]]:
+        """
+        Groups tagged workflow sections into batches to send together.
+
+        Sections are added to the current batch in order until it holds
+        `_MAX_BATCH_WORKFLOWS` sections or the batched prompt would exceed
+        `max_prompt_tokens`, at which point a new batch is started.
+
+        Args:
+            sections (list): The (workflow index, tagged section) pairs to send.
+
+        Returns:
+            list: The batches, each a non-empty list of (index, section) pairs.
+        """
+        batches: List[List[Tuple[int, str]]] = []
+        for section in sections:
+            if batches and len(batches[-1]) < _MAX_BATCH_WORKFLOWS:
+                candidate = batches[-1] + [section]
+                if self.max_prompt_tokens is None or not self._check_prompt_size(
+                    _batch_prompt([s for _, s in candidate])
+                ):
+                    batches[-1] = candidate
+                    continue
+            batches.append([section])
+        return batches
+
+    @staticmethod
+    def _read_max_prompt_tokens() -> Optional[int]:
+        """
+        Reads the prompt token budget from the `LLM_MAX_PROMPT_TOKENS` variable.
+
+        Returns:
+            Optional[int]: The budget, or None if the variable is unset or empty.
+
+        Raises:
+            ValueError: If the variable is not a positive integer.
+        """
+        value = os.getenv("LLM_MAX_PROMPT_TOKENS", "").strip()
+        if not value:
+            return None
+        error = f"LLM_MAX_PROMPT_TOKENS must be a positive integer, got '{value}'."
+        try:
+            max_prompt_tokens = int(value)
+        except ValueError:
+            raise ValueError(error) from None
+        if max_prompt_tokens <= 0:
+            raise ValueError(error)
+        return max_prompt_tokens
+
+    def _check_prompt_size(self, prompt: str) -> Optional[str]:
+        """
+        Checks a prompt against the configured token budget.
+
+        The system prompt is sent along with every request, so it counts
+        towards the budget as well.
+
+        Args:
+            prompt (str): The prompt about to be sent to the LLM.
+
+        Returns:
+            Optional[str]: An error message if the prompt is estimated to exceed
+                `max_prompt_tokens`, otherwise None.
+        """
+        if self.max_prompt_tokens is None:
+            return None
+        token_count = estimate_token_count(_SYSTEM_PROMPT)
+        token_count += estimate_token_count(prompt)
+        if token_count > self.max_prompt_tokens:
+            return (
+                f"Error: Workflow prompt is too large (~{token_count} tokens, "
+                f"limit {self.max_prompt_tokens})."
+            )
+        return None
+
+    def _cache_response(self, key: Optional[Hashable], response: str) -> None:
+        """
+        Caches a successfully generated LLM response.
+
+        LLM implementations report failures by raising `LLMError`, but ones
+        written before it existed return an "Error: ..." string instead; such
+        responses are never cached.
+
+        Args:
+            key (Optional[Hashable]): The cache key of the explained
+                configuration, or None if it cannot be cached.
+            response (str): The response returned by the LLM.
+        """
+        if key is not None and not response.startswith("Error:"):
+            self._response_cache[key] = response
+
+    def _prepare_prompts(
+        self, list_of_node_configurations: List[List[Dict[str, Any]]]
+    ) -> Tuple[List[Optional[str]], List[Optional[Hashable]], List[Tuple[int, str]]]:
+        """
+        Builds the prompts of the workflows that are not cached yet.
+
+        Args:
+            list_of_node_configurations (list): A list of pipeline node
+                configurations, one per workflow.
+
+        Returns:
+            tuple: Per workflow, its cached explanation or error message (None
+                if it still has to be explained), per workflow, its cache key,
+                and the (workflow index, prompt) pairs to send to the LLM.
+        """
+        results: List[Optional[str]] = [None] * len(list_of_node_configurations)
+        keys = [self._cache_key(config) for config in list_of_node_configurations]
+        pending = []
+        for idx, node_configurations in enumerate(list_of_node_configurations):
+            if keys[idx] in self._response_cache:
+                results[idx] = self._response_cache[keys[idx]]
+                continue
+            nodes, components, error = self._extract_components(node_configurations)
+            if error:
+                results[idx] = error
+                continue
+            prompt = self._generate_prompt(nodes, components)
+            error = self._check_prompt_size(prompt)
+            if error:
+                results[idx] = error
+                continue
+            pending.append((idx, prompt))
+        return results, keys, pending
+
+    def _extract_components(
+        self, node_configurations: List[Dict[str, Any]]
+    ) -> Tuple[List[NormalizedNode], List[Dict[str, Any]], Optional[str]]:
+        """
+        Extracts component metadata for every node of a pipeline configuration.
+
+        All nodes are validated and normalized before any metadata is
+        extracted; components that still have to be loaded are then
+        extracted concurrently.
+
+        Args:
+            node_configurations (list): List of pipeline node configurations.
+
+        Returns:
+            tuple: The normalized nodes, the extracted metadata for each node
+                and an error message, which is None if extraction succeeded.
+        """
         if not node_configurations:
-            return "The provided workflow configuration is empty."
+            return [], [], "The provided workflow configuration is empty."
 
-        components = []
-        for node in node_configurations:
-            processor_name = node.get("processor")
-            if not processor_name:
-                return f"Error: Missing 'processor' key in node configuration: {node}"
+        # Validate every node up front, before doing any per-node work
+        bad = next((n for n in node_configurations if not n.get("processor")), None)
+        if bad is not None:
+            return (
+                [],
+                [],
+                f"Error: Missing 'processor' key in node configuration: {bad}",
+            )
 
-            metadata = ComponentMetadataExtractor.get_metadata(processor_name)
-            if "error" in metadata:
-                return f"Error: {metadata['error']}"
+        nodes = [
+            NormalizedNode(
+                processor=node["processor"],
+                context_keyword=node.get("context_keyword", "None"),
+                parameters=(
+                    {} if node.get("parameters") is None else node["parameters"]
+                ),
+            )
+            for node in node_configurations
+        ]
 
-            components.append(metadata)
+        def get_metadata(node: NormalizedNode) -> Dict[str, Any]:
+            return ComponentMetadataExtractor.get_metadata(node.processor)
+
+        # Loading independent components can be overlapped in threads; this only
+        # pays off when several distinct components still have to be loaded
+        uncached = {
+            node.processor
+            for node in nodes
+            if not ComponentMetadataExtractor.is_cached(node.processor)
+        }
+        if len(uncached) > 1:
+            with ThreadPoolExecutor(
+                max_workers=min(_MAX_EXTRACTION_WORKERS, len(uncached))
+            ) as executor:
+                components = list(executor.map(get_metadata, nodes))
+        else:
+            components = [get_metadata(node) for node in nodes]
+
+        for metadata in components:
+            if "error" in metadata:
+                return [], [], f"Error: {metadata['error']}"
 
         self.logger.info(
             "Extracted metadata for components:\n%s",
-            pformat(components, indent=2, width=100),
+            _LazyStr(lambda: pformat(components, indent=2, width=100)),
         )
-        prompt = self._generate_prompt(node_configurations, components)
-        return self.llm.generate_response(prompt)
+        return nodes, components, None
 
     def _generate_prompt(
         self,
-        node_configurations: List[Dict[str, Any]],
+        nodes: List[NormalizedNode],
         components: List[Dict[str, Any]],
     ) -> str:
         """
         Generates an LLM prompt incorporating full pipeline configuration and metadata.
 
+        The prompt only carries the workflow-specific content; the instructions
+        are sent separately as the system prompt.
+
         Args:
-            node_configurations (list): The original pipeline structure.
+            nodes (list): The normalized pipeline structure.
             components (list): Extracted metadata for components in the workflow.
 
         Returns:
             str: A structured prompt for the LLM.
         """
         # Convert full pipeline configuration to a structured format
-        pipeline_structure = "\n".join(
-            [
-                (
-                    f"- Step {idx + 1}: {node.get('processor')}\n"
-                    f"  Context Keyword: {node.get('context_keyword', 'None')}\n"
-                    "  Parameters:\n"
-                    + "\n".join(
-                        [
-                            f"    - {key}: {value}"
-                            for key, value in (node.get("parameters") or {}).items()
-                        ]
-                    )
-                )
-                for idx, node in enumerate(node_configurations)
-                if isinstance(node.get("parameters"), dict)
-                or node.get("parameters") is None
-            ]
-        )
+        buf = io.StringIO()
+        for idx, node in enumerate(nodes):
+            if not isinstance(node.parameters, dict):
+                continue
+            if buf.tell():
+                buf.write("\n")
+            buf.write(f"- Step {idx + 1}: {node.processor}\n")
+            buf.write(f"  Context Keyword: {node.context_keyword}\n")
+            buf.write("  Parameters:\n")
+            sep = ""
+            for key, value in node.parameters.items():
+                buf.write(f"{sep}    - {key}: {value}")
+                sep = "\n"
+        pipeline_structure = buf.getvalue()
 
         # Convert extracted metadata into structured descriptions
         component_descriptions = "\n".join(
-            [
-                f"- {comp['component_name']}:\n"
-                f"  Description: {comp.get('docstring', 'No description available.')}\n"
-                f"  Module: {comp.get('module_path', 'Unknown')}\n"
-                f"  Class Hierarchy: {', '.join(map(str, comp.get('class_hierarchy', [])))}\n"
-                f"  Interfaces:\n"
-                + "\n".join(
-                    [
-                        f"    - {iface['interface_type']}: {iface['data_type']}"
-                        for iface in comp.get("interfaces", [])
-                        if isinstance(iface, dict)
-                        and "interface_type" in iface
-                        and "data_type" in iface
-                    ]
-                )
-                + f"\n  Processing Logic:\n"
-                + "\n".join(
-                    [
-                        f"    - {param['name']}: {param['type']}"
-                        for param in comp.get("processing_logic", {}).get(
-                            "parameters", []
-                        )
-                        if isinstance(param, dict)
-                        and "name" in param
-                        and "type" in param
-                    ]
-                )
-                for comp in components
-            ]
+            _render_component(comp) for comp in components
         )
 
-        # Construct a smarter LLM prompt with structured pipeline and metadata
-        return f"""
-        You are an AI workflow assistant. Given the following pipeline configuration, 
-        explain how it works in a clear and structured manner.
-
-        **Pipeline Configuration:**
-        {pipeline_structure}
-
-        **Component Details:**
-        {component_descriptions}
-
-        Provide a detailed, structured, and human-readable explanation of the workflow.
-        """
+        return _WORKFLOW_TEMPLATE.format_map(
+            {
+                "pipeline_structure": pipeline_structure,
+                "component_descriptions": component_descriptions,
+            }
+        )
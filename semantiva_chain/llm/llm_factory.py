@@ -4,11 +4,30 @@ Factory class for dynamically selecting an LLM provider.
 Allows runtime injection of different LLMs.
 """
 
+from typing import Callable, Dict, Optional
 from .llm_interface import LLMInterface
-from .llm_openai import OpenAILLM
 from .llm_mock import MockLLM
 
 
+def _create_openai_llm(api_key: str, model: Optional[str]) -> LLMInterface:
+    """
+    Creates an OpenAI LLM instance.
+
+    The OpenAI backend is imported here rather than at module level, so the
+    `openai` SDK is only loaded when this provider is actually selected.
+    """
+    from .llm_openai import OpenAILLM
+
+    return OpenAILLM(api_key, model or "gpt-4o-mini")
+
+
+# Maps a provider name to a callable building an LLM from (api_key, model)
+_PROVIDERS: Dict[str, Callable[[str, Optional[str]], LLMInterface]] = {
+    "openai": _create_openai_llm,
+    "mock": lambda api_key, model: MockLLM(api_key, model or "mock"),
+}
+
+
 class LLMFactory:
     """
     Factory for instantiating LLM providers dynamically.
@@ -19,6 +38,9 @@ class LLMFactory:
     Methods:
         get_llm(provider: str, api_key: str, model: str = None) -> LLMInterface:
             Returns an LLM instance based on the selected provider.
+
+        register(provider: str, factory: Callable) -> None:
+            Registers an additional LLM provider.
     """
 
     @staticmethod
@@ -27,7 +49,7 @@ class LLMFactory:
         Returns an LLM instance based on the provider.
 
         Args:
-            provider (str): The LLM provider ("openai" or "deepseek").
+            provider (str): The LLM provider (e.g. "openai" or "mock").
             api_key (str): The API key for authentication.
             model (str, optional): The model to use (default models are used if None).
 
@@ -39,11 +61,27 @@ class LLMFactory:
         """
         provider = provider.lower()
 
-        if provider == "openai":
-            return OpenAILLM(api_key, model or "gpt-4o-mini")
-        elif provider == "mock":
-            return MockLLM(api_key, model or "mock")
-        else:
+        factory = _PROVIDERS.get(provider)
+        if factory is None:
+            choices = ", ".join(f"'{name}'" for name in sorted(_PROVIDERS))
             raise ValueError(
-                f"Unsupported LLM provider: '{provider}'. Choose 'openai' or 'mock'."
+                f"Unsupported LLM provider: '{provider}'. Choose one of: {choices}."
             )
+        return factory(api_key, model)
+
+    @staticmethod
+    def register(
+        provider: str, factory: Callable[[str, Optional[str]], LLMInterface]
+    ) -> None:
+        """
+        Registers an LLM provider so it can be selected by name.
+
+        Registering an existing name replaces the previous provider. The LLM
+        instances it creates should report failures by raising `LLMError`.
+
+        Args:
+            provider (str): The provider name, matched case-insensitively.
+            factory (Callable): A callable taking the API key and the model
+                (None if not specified) and returning an LLMInterface instance.
+        """
+        _PROVIDERS[provider.lower()] = factory
@@ -2,23 +2,49 @@
 Defines the LLM interface for integrating different AI models.
 
 All LLM implementations must inherit from this interface and implement
-the `generate_response` method.
+the `generate_response` method. Implementations backed by an asynchronous
+client may also override `agenerate_response`. Failures are reported by
+raising `LLMError`. Returning an "Error: ..." string instead, the earlier
+convention, is deprecated.
 """
 
+import asyncio
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Iterator, Optional, Tuple
 from semantiva.logger import Logger
 
 
+class LLMError(Exception):
+    """
+    Raised when an LLM implementation fails to generate a response.
+    """
+
+
 class LLMInterface(ABC):
     """
     Abstract base class for LLM integrations.
 
+    Attributes:
+        supports_system_prompt (bool): Whether the implementation honours the
+            "system_prompt" request parameter. Implementations that send it as
+            a separate system message should set this to True.
+
     Methods:
         generate_response(prompt: str, parameters: Dict[str, Any] = None) -> str:
             Generates a response from the LLM based on the input prompt.
+
+        agenerate_response(prompt: str, parameters: Dict[str, Any] = None) -> str:
+            Asynchronous counterpart of `generate_response`.
+
+        generate_response_stream(prompt: str, parameters: Dict[str, Any] = None) -> Iterator[str]:
+            Yields the response incrementally as it is generated.
+
+        prepare_request(prompt: str, system_prompt: str, parameters: Dict[str, Any] = None) -> Tuple[str, Dict[str, Any]]:
+            Combines a prompt and system instructions into request arguments.
     """
 
+    supports_system_prompt: bool = False
+
     def __init__(self, logger: Optional[Logger] = None):
         if logger:
             # If a logger instance is provided, use it
@@ -35,8 +61,86 @@ class LLMInterface(ABC):
         Args:
             prompt (str): The input prompt for the model.
             parameters (Dict[str, Any], optional): Additional parameters for the model.
+                Implementations that set `supports_system_prompt` also accept a
+                "system_prompt" entry holding instructions to send separately
+                from the prompt. Use `prepare_request` to build the arguments
+                so that providers without that support still receive them.
 
         Returns:
             str: The generated response from the LLM.
+
+        Raises:
+            LLMError: If the response could not be generated.
         """
         pass
+
+    def prepare_request(
+        self,
+        prompt: str,
+        system_prompt: str,
+        parameters: Dict[str, Any] = None,
+    ) -> Tuple[str, Dict[str, Any]]:
+        """
+        Builds the prompt and parameters for a request with system instructions.
+
+        If the implementation supports a separate system prompt, it is passed
+        as the "system_prompt" parameter; otherwise it is prepended to the
+        prompt so that the instructions are never dropped.
+
+        Args:
+            prompt (str): The input prompt for the model.
+            system_prompt (str): Instructions for the model.
+            parameters (Dict[str, Any], optional): Additional parameters for the model.
+
+        Returns:
+            Tuple[str, Dict[str, Any]]: The prompt and a new parameters
+                dictionary to pass to `generate_response` or its variants.
+        """
+        parameters = dict(parameters or {})
+        if self.supports_system_prompt:
+            parameters["system_prompt"] = system_prompt
+            return prompt, parameters
+        return f"{system_prompt}\n\n{prompt}", parameters
+
+    async def agenerate_response(
+        self, prompt: str, parameters: Dict[str, Any] = None
+    ) -> str:
+        """
+        Asynchronously generates a response from the LLM.
+
+        The default implementation runs `generate_response` in a worker thread
+        so that several requests can be awaited concurrently.
+
+        Args:
+            prompt (str): The input prompt for the model.
+            parameters (Dict[str, Any], optional): Additional parameters for the model.
+
+        Returns:
+            str: The generated response from the LLM.
+
+        Raises:
+            LLMError: If the response could not be generated.
+        """
+        return await asyncio.to_thread(self.generate_response, prompt, parameters)
+
+    def generate_response_stream(
+        self, prompt: str, parameters: Dict[str, Any] = None
+    ) -> Iterator[str]:
+        """
+        Generates a response from the LLM, yielding it in chunks as it arrives.
+
+        The default implementation yields the complete response of
+        `generate_response` as a single chunk.
+
+        Args:
+            prompt (str): The input prompt for the model.
+            parameters (Dict[str, Any], optional): Additional parameters for the model.
+
+        Yields:
+            str: Successive fragments of the generated response.
+
+        Raises:
+            LLMError: If the response could not be generated. Fragments yielded
+                before the error are incomplete.
+        """
+        yield self.generate_response(prompt, parameters)
@@ -4,7 +4,7 @@ Mock API wrapper for Semantiva-Chain.
 Handles interaction with a Mock model.
 """
 
-from .llm_interface import LLMInterface
+from .llm_interface import LLMError, LLMInterface
 from semantiva.logger import Logger
 
 from typing import Dict, Any, Optional
@@ -43,7 +43,7 @@ class MockLLM(LLMInterface):
             str: The generated response from the LLM.
 
         Raises:
-            Exception: If an error occurs while interacting with OpenAI's API.
+            LLMError: If an error occurs while generating the mock response.
         """
         parameters = parameters or {}
         try:
@@ -52,4 +52,4 @@ class MockLLM(LLMInterface):
             )
             return mock_response
         except Exception as e:
-            return f"Error: {str(e)}"
+            raise LLMError(str(e)) from e
@@ -4,14 +4,19 @@ OpenAI API wrapper for Semantiva-Chain.
 Handles interaction with OpenAI’s GPT-based models.
 """
 
-from .llm_interface import LLMInterface
+from .llm_interface import LLMError, LLMInterface
 
 
+import asyncio
+import weakref
 import openai
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Iterator, Optional
 from semantiva.logger import Logger
 
 
+_DEFAULT_SYSTEM_PROMPT = "You are an AI workflow assistant."
+
+
 class OpenAILLM(LLMInterface):
     """
     OpenAI API wrapper for Semantiva-Chain.
@@ -26,8 +31,16 @@ class OpenAILLM(LLMInterface):
     Methods:
         generate_response(prompt: str, parameters: Dict[str, Any] = None) -> str:
             Sends a request to OpenAI's API and returns the response.
+
+        agenerate_response(prompt: str, parameters: Dict[str, Any] = None) -> str:
+            Sends a request through the asynchronous OpenAI client.
+
+        generate_response_stream(prompt: str, parameters: Dict[str, Any] = None) -> Iterator[str]:
+            Streams the response from OpenAI's API as it is generated.
     """
 
+    supports_system_prompt = True
+
     def __init__(
         self, api_key: str, model: str = "gpt-4o-mini", logger: Optional[Logger] = None
     ):
@@ -41,38 +54,156 @@ class OpenAILLM(LLMInterface):
         super().__init__(logger)
         self.api_key = api_key
         self.model = model
+        # Clients are created on first use and then reused, so their
+        # connection pools persist across requests. Asynchronous clients are
+        # bound to the event loop they run on, so there is one per loop.
+        self._client: Optional[openai.OpenAI] = None
+        self._async_clients: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
         self.logger.info(f"Initialized OpenAI LLM with model: {self.model}")
 
+    def _get_client(self) -> openai.OpenAI:
+        """
+        Returns the shared OpenAI client, creating it on first use.
+
+        Raises:
+            openai.OpenAIError: If the client cannot be created, e.g. because
+                no API key is available.
+        """
+        if self._client is None:
+            self._client = openai.OpenAI(api_key=self.api_key)
+        return self._client
+
+    def _get_async_client(self) -> openai.AsyncOpenAI:
+        """
+        Returns the asynchronous OpenAI client of the running event loop.
+
+        The client's connections cannot be used from another event loop, so a
+        client is created on first use in each loop and dropped with the loop.
+
+        Raises:
+            openai.OpenAIError: If the client cannot be created, e.g. because
+                no API key is available.
+        """
+        loop = asyncio.get_running_loop()
+        client = self._async_clients.get(loop)
+        if client is None:
+            client = self._async_clients[loop] = openai.AsyncOpenAI(
+                api_key=self.api_key
+            )
+        return client
+
+    @staticmethod
+    def _build_messages(prompt: str, parameters: Dict[str, Any]) -> list:
+        """
+        Builds the chat messages for a request.
+
+        The system prompt is placed first, so requests sharing it also begin
+        with the same messages.
+
+        Args:
+            prompt (str): The input prompt for the model.
+            parameters (Dict[str, Any]): Request parameters, optionally
+                including a "system_prompt".
+
+        Returns:
+            list: The messages to send to the chat completions API.
+        """
+        return [
+            {
+                "role": "system",
+                "content": parameters.get("system_prompt", _DEFAULT_SYSTEM_PROMPT),
+            },
+            {"role": "user", "content": prompt},
+        ]
+
     def generate_response(self, prompt: str, parameters: Dict[str, Any] = None) -> str:
         """
         Generates a response using OpenAI's GPT API.
 
         Args:
             prompt (str): The input prompt for the model.
-            parameters (Dict[str, Any], optional): Additional parameters like temperature and max tokens.
+            parameters (Dict[str, Any], optional): Additional parameters like temperature, max tokens and system prompt.
+
+        Returns:
+            str: The generated response from the LLM.
+
+        Raises:
+            LLMError: If an error occurs while interacting with OpenAI's API.
+        """
+        return "".join(self.generate_response_stream(prompt, parameters))
+
+    def generate_response_stream(
+        self, prompt: str, parameters: Dict[str, Any] = None
+    ) -> Iterator[str]:
+        """
+        Generates a response using OpenAI's GPT API, yielding tokens as they arrive.
+
+        Args:
+            prompt (str): The input prompt for the model.
+            parameters (Dict[str, Any], optional): Additional parameters like temperature, max tokens and system prompt.
+
+        Yields:
+            str: Successive fragments of the generated response.
+
+        Raises:
+            LLMError: If an error occurs while interacting with OpenAI's API,
+                including after some fragments have been yielded.
+        """
+        parameters = parameters or {}
+        chunks = []
+        try:
+            message = self._build_messages(prompt, parameters)
+            self.logger.info(f"Sending prompt to OpenAI model: {prompt}")
+
+            response = self._get_client().chat.completions.create(
+                model=self.model,
+                messages=message,
+                temperature=parameters.get("temperature", 0.7),
+                max_tokens=parameters.get("max_tokens", 1000),
+                stream=True,
+            )
+            for event in response:
+                if not event.choices:
+                    continue
+                content = event.choices[0].delta.content
+                if content:
+                    chunks.append(content)
+                    yield content
+            self.logger.info(f"Received response from OpenAI model: {''.join(chunks)}")
+        except Exception as e:
+            raise LLMError(str(e)) from e
+
+    async def agenerate_response(
+        self, prompt: str, parameters: Dict[str, Any] = None
+    ) -> str:
+        """
+        Asynchronously generates a response using OpenAI's GPT API.
+
+        Concurrent calls are sent to the API in parallel instead of one after
+        the other.
+
+        Args:
+            prompt (str): The input prompt for the model.
+            parameters (Dict[str, Any], optional): Additional parameters like temperature, max tokens and system prompt.
 
         Returns:
             str: The generated response from the LLM.
 
         Raises:
-            Exception: If an error occurs while interacting with OpenAI's API.
+            LLMError: If an error occurs while interacting with OpenAI's API.
         """
         parameters = parameters or {}
         try:
-            message = [
-                {"role": "system", "content": "You are an AI workflow assistant."},
-                {"role": "user", "content": prompt},
-            ]
+            message = self._build_messages(prompt, parameters)
             self.logger.info(f"Sending prompt to OpenAI model: {prompt}")
 
-            response = openai.ChatCompletion.create(
+            response = await self._get_async_client().chat.completions.create(
                 model=self.model,
                 messages=message,
-                api_key=self.api_key,
                 temperature=parameters.get("temperature", 0.7),
                 max_tokens=parameters.get("max_tokens", 1000),
             )
             self.logger.info(f"Received response from OpenAI model: {response}")
-            return response["choices"][0]["message"]["content"]
+            return response.choices[0].message.content
         except Exception as e:
-            return f"Error: {str(e)}"
+            raise LLMError(str(e)) from e
@@ -50,5 +50,12 @@ node_configurations = [
     },
 ]
 
-explanation = workflow_explainer.explain(node_configurations)
+# Print the explanation as it is generated, then log it in full.
+chunks = []
+for chunk in workflow_explainer.explain_stream(node_configurations):
+    print(chunk, end="", flush=True)
+    chunks.append(chunk)
+print()
+
+explanation = "".join(chunks)
 logger.info(explanation)
@@ -0,0 +1,80 @@
+import inspect
+from typing import Any, Callable, Dict, List, Literal, Optional, Tuple, Union
+
+import pytest
+
+pytest.importorskip("semantiva")
+
+from semantiva_chain.core import component_metadata_extractor  # noqa: E402
+from semantiva_chain.core.component_metadata_extractor import (  # noqa: E402
+    ComponentMetadataExtractor,
+)
+
+
+@pytest.mark.parametrize(
+    "annotation, expected",
+    [
+        (int, "int"),
+        (None, "None"),
+        (Any, "Any"),
+        (inspect.Parameter.empty, "Unknown"),
+        ("Unresolved", "Unresolved"),
+        (List[int], "list[int]"),
+        (list[int], "list[int]"),
+        (Dict[str, List[int]], "dict[str, list[int]]"),
+        (Tuple[int, ...], "tuple[int, ...]"),
+        (Optional[int], "int | None"),
+        (Union[int, str], "int | str"),
+        (int | None, "int | None"),
+        (Literal["a", 1], "Literal['a', 1]"),
+        (Callable[[int, str], bool], "Callable[[int, str], bool]"),
+        (List["Unresolved"], "list[Unresolved]"),  # noqa: F821
+    ],
+)
+def test_format_type(annotation, expected):
+    assert ComponentMetadataExtractor._format_type(annotation) == expected
+
+
+class _Component:
+    def _process_logic(
+        self,
+        data: "List[int]",
+        missing: "Missing",  # noqa: F821
+        count: int,
+        raw,
+    ):
+        """Processes the data."""
+
+
+def test_processing_logic_resolves_hints_per_parameter():
+    logic = ComponentMetadataExtractor._get_processing_logic(_Component)
+
+    assert logic["parameters"] == [
+        {"name": "data", "type": "list[int]"},
+        {"name": "missing", "type": "Missing"},
+        {"name": "count", "type": "int"},
+        {"name": "raw", "type": "Unknown"},
+    ]
+    assert logic["description"] == "Processes the data."
+
+
+def test_get_metadata_shares_cached_values(monkeypatch):
+    monkeypatch.setattr(
+        component_metadata_extractor, "_CLASS_CACHE", {"Component": _Component}
+    )
+
+    first = ComponentMetadataExtractor.get_metadata("Component")
+    second = ComponentMetadataExtractor.get_metadata("Component")
+
+    assert first == second
+    assert first["component_name"] == "Component"
+    assert first["class_hierarchy"] == ["_Component"]
+    # Each caller gets its own dict, backed by the same cached values
+    assert first is not second
+    assert first["processing_logic"] is second["processing_logic"]
+    first["docstring"] = "Changed"
+    assert second["docstring"] is None
+
+    cached = ComponentMetadataExtractor._get_class_metadata(_Component)
+    with pytest.raises(TypeError):
+        cached["docstring"] = "Changed"
@@ -0,0 +1,55 @@
+from typing import Any, Dict
+
+import pytest
+
+pytest.importorskip("semantiva")
+
+from semantiva_chain.llm.llm_interface import LLMInterface  # noqa: E402
+
+
+class _PlainLLM(LLMInterface):
+    """An LLM without support for a separate system prompt."""
+
+    supports_system_prompt = False
+
+    def generate_response(self, prompt: str, parameters: Dict[str, Any] = None) -> str:
+        return prompt
+
+
+class _SystemPromptLLM(_PlainLLM):
+    """An LLM that sends the system prompt as a separate message."""
+
+    supports_system_prompt = True
+
+
+def test_prepare_request_prepends_system_prompt_without_support():
+    parameters = {"temperature": 0.2}
+
+    prompt, prepared = _PlainLLM().prepare_request("Explain.", "Be brief.", parameters)
+
+    assert prompt == "Be brief.\n\nExplain."
+    assert prepared == {"temperature": 0.2}
+    assert prepared is not parameters
+
+
+def test_prepare_request_passes_system_prompt_as_parameter():
+    parameters = {"temperature": 0.2}
+
+    prompt, prepared = _SystemPromptLLM().prepare_request(
+        "Explain.", "Be brief.", parameters
+    )
+
+    assert prompt == "Explain."
+    assert prepared == {"temperature": 0.2, "system_prompt": "Be brief."}
+    # The caller's parameters are left untouched
+    assert parameters == {"temperature": 0.2}
+
+
+def test_prepare_request_builds_fresh_parameters_per_call():
+    llm = _SystemPromptLLM()
+
+    _, first = llm.prepare_request("Explain.", "Be brief.")
+    first["max_tokens"] = 10
+    _, second = llm.prepare_request("Explain.", "Be brief.")
+
+    assert second == {"system_prompt": "Be brief."}
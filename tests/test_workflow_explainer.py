@@ -0,0 +1,271 @@
+import asyncio
+import threading
+import time
+from typing import Any, Dict, List
+
+import pytest
+
+pytest.importorskip("semantiva")
+
+from semantiva_chain.core.component_metadata_extractor import (  # noqa: E402
+    ComponentMetadataExtractor,
+)
+from semantiva_chain.core.workflow_explainer import (  # noqa: E402
+    _MAX_BATCH_WORKFLOWS,
+    _MAX_TOKENS_PER_WORKFLOW,
+    _SYSTEM_PROMPT,
+    WorkflowExplainer,
+    _batch_prompt,
+    _freeze,
+    _render_component,
+    estimate_token_count,
+)
+from semantiva_chain.llm.llm_interface import LLMError, LLMInterface  # noqa: E402
+
+
+class _FakeLLM(LLMInterface):
+    """Returns canned responses and records the requests it receives."""
+
+    supports_system_prompt = True
+
+    def __init__(self, response: Any):
+        super().__init__()
+        self.response = response
+        self.prompts: List[str] = []
+        self.parameters: List[Dict[str, Any]] = []
+
+    def generate_response(self, prompt: str, parameters: Dict[str, Any] = None) -> str:
+        self.prompts.append(prompt)
+        self.parameters.append(parameters)
+        if isinstance(self.response, Exception):
+            raise self.response
+        return self.response
+
+
+@pytest.fixture
+def explainer(monkeypatch):
+    monkeypatch.setenv("LLM_PROVIDER", "mock")
+    monkeypatch.delenv("LLM_MAX_PROMPT_TOKENS", raising=False)
+    monkeypatch.setattr(
+        ComponentMetadataExtractor,
+        "get_metadata",
+        staticmethod(lambda name: {"component_name": name, "docstring": name}),
+    )
+    monkeypatch.setattr(
+        ComponentMetadataExtractor, "is_cached", staticmethod(lambda name: True)
+    )
+    explainer = WorkflowExplainer()
+    yield explainer
+    explainer.clear_cache()
+
+
+WORKFLOWS = [
+    [{"processor": "ProcessorA"}],
+    [{"processor": "ProcessorB"}],
+]
+
+
+def test_explain_many_splits_tagged_response(explainer):
+    explainer.llm = _FakeLLM("[2] second [/2]\n[1]\nfirst\n[/1]")
+
+    assert explainer.explain_many(WORKFLOWS) == ["first", "second"]
+    assert len(explainer.llm.prompts) == 1
+    assert "[1]\n" in explainer.llm.prompts[0]
+    assert "[2]\n" in explainer.llm.prompts[0]
+
+    # Both explanations are cached, so explaining again sends no request
+    assert explainer.explain_many(WORKFLOWS) == ["first", "second"]
+    assert len(explainer.llm.prompts) == 1
+
+
+def test_explain_many_scales_output_tokens_with_the_batch(explainer):
+    workflows = [
+        [{"processor": f"Processor{i}"}] for i in range(_MAX_BATCH_WORKFLOWS + 1)
+    ]
+    explainer.llm = _FakeLLM("")
+
+    explainer.explain_many(workflows)
+
+    assert [params["max_tokens"] for params in explainer.llm.parameters] == [
+        _MAX_TOKENS_PER_WORKFLOW * _MAX_BATCH_WORKFLOWS,
+        _MAX_TOKENS_PER_WORKFLOW,
+    ]
+    assert f"[{_MAX_BATCH_WORKFLOWS + 1}]\n" in explainer.llm.prompts[1]
+
+
+def test_explain_many_reports_missing_segments(explainer):
+    explainer.llm = _FakeLLM("[1]first[/1] [2]unterminated")
+
+    assert explainer.explain_many(WORKFLOWS) == [
+        "first",
+        "Error: No explanation returned for workflow 2.",
+    ]
+
+    # Only the parsed explanation was cached
+    explainer.llm = _FakeLLM("[2]second[/2]")
+    assert explainer.explain_many(WORKFLOWS) == ["first", "second"]
+
+
+def test_explain_many_reports_failed_request_for_every_workflow(explainer):
+    explainer.llm = _FakeLLM(LLMError("rate limited"))
+    invalid = [{"parameters": {}}]
+
+    results = explainer.explain_many([WORKFLOWS[0], invalid, WORKFLOWS[1]])
+
+    assert results[0] == "Error: rate limited"
+    assert results[1].startswith("Error: Missing 'processor' key")
+    assert results[2] == "Error: rate limited"
+
+    # Failures are not cached
+    explainer.llm = _FakeLLM("[1]first[/1][2]second[/2]")
+    assert explainer.explain_many(WORKFLOWS) == ["first", "second"]
+
+
+@pytest.mark.parametrize("value", ["abc", "1.5", "0", "-10"])
+def test_invalid_max_prompt_tokens_names_the_variable(explainer, monkeypatch, value):
+    monkeypatch.setenv("LLM_MAX_PROMPT_TOKENS", value)
+
+    with pytest.raises(ValueError, match="LLM_MAX_PROMPT_TOKENS"):
+        WorkflowExplainer()
+
+
+def test_explain_many_splits_batches_to_fit_the_budget(explainer):
+    single = explainer._generate_prompt(
+        *explainer._extract_components(WORKFLOWS[0])[:2]
+    )
+    explainer.max_prompt_tokens = (
+        estimate_token_count(_SYSTEM_PROMPT)
+        + estimate_token_count(_batch_prompt([f"[1]\n{single}"]))
+        + 1
+    )
+    explainer.llm = _FakeLLM("[1]first[/1][2]second[/2]")
+
+    assert explainer.explain_many(WORKFLOWS) == ["first", "second"]
+    assert len(explainer.llm.prompts) == 2
+    assert "[1]\n" in explainer.llm.prompts[0]
+    assert "[2]\n" in explainer.llm.prompts[1]
+    for prompt in explainer.llm.prompts:
+        assert explainer._check_prompt_size(prompt) is None
+
+
+def test_explain_many_rejects_batch_over_the_budget(explainer):
+    explainer.max_prompt_tokens = estimate_token_count(_SYSTEM_PROMPT) + 1
+    explainer.llm = _FakeLLM("[1]first[/1]")
+
+    results = explainer.explain_many(WORKFLOWS)
+
+    assert all(
+        result.startswith("Error: Workflow prompt is too large") for result in results
+    )
+    assert explainer.llm.prompts == []
+
+
+def test_explain_many_async_builds_prompts_off_the_event_loop(explainer, monkeypatch):
+    threads = []
+
+    def get_metadata(name):
+        threads.append(threading.get_ident())
+        return {"component_name": name}
+
+    monkeypatch.setattr(
+        ComponentMetadataExtractor, "get_metadata", staticmethod(get_metadata)
+    )
+    explainer.llm = _FakeLLM("explained")
+
+    results = asyncio.run(explainer.explain_many_async(WORKFLOWS))
+
+    assert results == ["explained", "explained"]
+    assert threads and threading.get_ident() not in threads
+
+
+def test_render_component_follows_metadata_changes(explainer):
+    first = _render_component({"component_name": "Renamed", "docstring": "Old."})
+    second = _render_component({"component_name": "Renamed", "docstring": "New."})
+
+    assert "Description: Old." in first
+    assert "Description: New." in second
+
+
+def test_extract_components_loads_uncached_components_concurrently(
+    explainer, monkeypatch
+):
+    threads = []
+
+    def get_metadata(name):
+        threads.append(threading.get_ident())
+        # Earlier nodes finish last, so results arrive out of order
+        time.sleep(0.01 * (5 - int(name[-1])))
+        if name.startswith("Missing"):
+            return {"error": f"Component '{name}' not found."}
+        return {"component_name": name}
+
+    monkeypatch.setattr(
+        ComponentMetadataExtractor, "get_metadata", staticmethod(get_metadata)
+    )
+    monkeypatch.setattr(
+        ComponentMetadataExtractor, "is_cached", staticmethod(lambda name: False)
+    )
+
+    nodes, components, error = explainer._extract_components(
+        [{"processor": f"Processor{i}"} for i in range(4)]
+    )
+    assert error is None
+    assert [node.processor for node in nodes] == [f"Processor{i}" for i in range(4)]
+    assert [comp["component_name"] for comp in components] == [
+        f"Processor{i}" for i in range(4)
+    ]
+    assert threading.get_ident() not in threads
+
+    _, _, error = explainer._extract_components(
+        [
+            {"processor": "Processor0"},
+            {"processor": "Missing1"},
+            {"processor": "Processor2"},
+            {"processor": "Missing3"},
+        ]
+    )
+    assert error == "Error: Component 'Missing1' not found."
+
+
+class _Named:
+    def __init__(self, value: Any):
+        self.value = value
+
+    def __str__(self) -> str:
+        return "Named"
+
+
+def test_cache_key_accepts_mixed_type_dict_keys():
+    config = [{"processor": "ProcessorA", "parameters": {1: "a", "b": 2}}]
+    reordered = [{"parameters": {"b": 2, 1: "a"}, "processor": "ProcessorA"}]
+
+    assert WorkflowExplainer._cache_key(config) is not None
+    assert WorkflowExplainer._cache_key(config) == WorkflowExplainer._cache_key(
+        reordered
+    )
+
+
+def test_cache_key_skips_objects_with_the_same_str():
+    first = [{"processor": "ProcessorA", "parameters": {"x": _Named(1)}}]
+    second = [{"processor": "ProcessorA", "parameters": {"x": _Named(2)}}]
+
+    assert WorkflowExplainer._cache_key(first) is None
+    assert WorkflowExplainer._cache_key(second) is None
+    with pytest.raises(TypeError):
+        _freeze(_Named(1))
+
+
+@pytest.mark.parametrize(
+    "first, second", [(1, True), (1, 1.0), (True, 1.0), ([1, 2], (1, 2))]
+)
+def test_freeze_distinguishes_types(first, second):
+    assert _freeze(first) != _freeze(second)
+    assert _freeze(first) == _freeze(first)
+
+
+def test_explain_does_not_cache_legacy_error_strings(explainer):
+    explainer.llm = _FakeLLM("Error: rate limited")
+    assert explainer.explain(WORKFLOWS[0]) == "Error: rate limited"
+
+    explainer.llm = _FakeLLM("explained")
+    assert explainer.explain(WORKFLOWS[0]) == "explained"